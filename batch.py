@@ -0,0 +1,117 @@
+"""Solve many puzzles at once across a pool of worker processes.
+
+Usage:
+    python batch.py [puzzles.txt[.gz|.bz2]] [--output FILE] [--workers N] [--chunksize N]
+                    [--backend NAME] [--variant NAME] [--unordered]
+
+Puzzles are streamed one per line from the file, or stdin when no file is
+given; lines that are not valid grids are skipped. Each result is written as
+`puzzle,solution`, with '-' as the solution when the puzzle has none.
+"""
+import argparse
+import collections
+import multiprocessing
+import queue
+
+import puzzle_io
+import solution
+
+
+def _solve_chunk(chunk, backend, variant):
+    """Worker side: solve one chunk of grids, returning (grid, values) pairs."""
+    results = []
+    for grid in chunk:
+        results.append((grid, solution.solve(grid, backend=backend, variant=variant)))
+    return results
+
+
+def _chunked(grids, chunksize):
+    chunk = []
+    for grid in grids:
+        chunk.append(grid)
+        if len(chunk) == chunksize:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def solve_many(grids, workers=None, chunksize=256, backend='bitmask', ordered=True, variant=None):
+    """Solve an iterable of grid strings on a process pool.
+
+    Grids are sent to the workers in chunks and only a few chunks per worker
+    are in flight at any time, so an arbitrarily long (or lazy) input is
+    consumed at the rate the pool solves it.
+
+    Args:
+        grids(iterable): grid strings in the form accepted by grid_values.
+        workers(int): number of worker processes, defaults to the CPU count.
+            1 solves in this process without a pool.
+        chunksize(int): grids per task sent to a worker.
+        backend(string): solver backend, see solution.solve.
+        ordered(bool): yield results in input order, otherwise as chunks complete.
+        variant(Variant or string): the variant to solve, see solution.solve.
+    Yields:
+        (grid, values) pairs where values is what solution.solve returned.
+    """
+    if workers == 1:
+        for chunk in _chunked(grids, chunksize):
+            for item in _solve_chunk(chunk, backend, variant):
+                yield item
+        return
+
+    workers = workers or multiprocessing.cpu_count()
+    in_flight = 2 * workers
+    with multiprocessing.Pool(workers) as pool:
+        if ordered:
+            pending = collections.deque()
+            for chunk in _chunked(grids, chunksize):
+                pending.append(pool.apply_async(_solve_chunk, (chunk, backend, variant)))
+                if len(pending) >= in_flight:
+                    for item in pending.popleft().get():
+                        yield item
+            while pending:
+                for item in pending.popleft().get():
+                    yield item
+        else:
+            done = queue.Queue()
+            running = 0
+            for chunk in _chunked(grids, chunksize):
+                pool.apply_async(_solve_chunk, (chunk, backend, variant), callback=done.put, error_callback=done.put)
+                running += 1
+                while running >= in_flight:
+                    running -= 1
+                    for item in _completed(done.get()):
+                        yield item
+            while running:
+                running -= 1
+                for item in _completed(done.get()):
+                    yield item
+
+
+def _completed(result):
+    if isinstance(result, BaseException):
+        raise result
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Solve sudoku puzzles, one per line.')
+    parser.add_argument('path', nargs='?', default='-', help='puzzle file, stdin if omitted')
+    parser.add_argument('-o', '--output', default='-', help='result file, stdout if omitted')
+    parser.add_argument('-w', '--workers', type=int, default=None)
+    parser.add_argument('-c', '--chunksize', type=int, default=256)
+    parser.add_argument('-b', '--backend', default='bitmask')
+    parser.add_argument('-v', '--variant', default=None, help='classic, diagonal or windoku')
+    parser.add_argument('--unordered', action='store_true', help='write results as they complete')
+    args = parser.parse_args(argv)
+
+    results = solve_many(puzzle_io.read_puzzles(args.path), workers=args.workers, chunksize=args.chunksize,
+                         backend=args.backend, ordered=not args.unordered, variant=args.variant)
+    with puzzle_io.SolutionWriter(args.output) as writer:
+        for grid, values in results:
+            writer.write(grid, solution.values_to_grid(values, args.variant) if values else None)
+
+
+if __name__ == '__main__':
+    main()
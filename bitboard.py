@@ -0,0 +1,283 @@
+"""Bitmask candidate board engine.
+
+A board is a flat list of 81 ints, one per box in the variant's `boxes` order.
+Bit d-1 of an entry is set when digit d is still a candidate for that box,
+so a solved box has exactly one bit set and an empty mask is a contradiction.
+The strategies here mirror the dictionary based ones in solution.py but work
+on the variant's index tables instead of the string keyed `units`/`peers` dicts.
+Every function takes an optional variant, defaulting to solution.default_variant.
+"""
+import solution
+
+# all candidates for a box, '123456789' in the dictionary form
+ALL = (1 << 9) - 1
+
+# lookup tables over every possible 9-bit mask
+BIT = dict((d, 1 << i) for i, d in enumerate('123456789'))
+POPCOUNT = tuple(bin(m).count('1') for m in range(ALL + 1))
+DIGITS = tuple(''.join(d for d in '123456789' if m & BIT[d]) for m in range(ALL + 1))
+
+
+def from_values(values, variant=None):
+    """Convert a sudoku in dictionary form into a board.
+
+    Args:
+        values(dict): a dictionary of the form {'box_name': '123456789', ...}
+        variant: the Variant (or its name) the sudoku belongs to.
+    Returns:
+        list of 81 candidate masks.
+    """
+    board = []
+    for box in solution.topology(variant).boxes:
+        mask = 0
+        for digit in values[box]:
+            mask |= BIT[digit]
+        board.append(mask)
+    return board
+
+
+def to_values(board, variant=None):
+    """Convert a board back into the dictionary form used by solution.py.
+
+    Args:
+        board(list): 81 candidate masks.
+        variant: the Variant (or its name) the board belongs to.
+    Returns:
+        dict of the form {'box_name': '123456789', ...}. False if board is False.
+    """
+    if board is False:
+        return False
+    return dict((box, DIGITS[mask]) for box, mask in zip(solution.topology(variant).boxes, board))
+
+
+def grid_board(grid, variant=None):
+    """Parse a grid string straight into a board, following grid_values rules."""
+    size = len(solution.topology(variant).boxes)
+    board = []
+    for c in grid:
+        if c == '.':
+            board.append(ALL)
+        elif c in BIT:
+            board.append(BIT[c])
+    assert len(board) == size
+    return board
+
+
+def eliminate(board, variant=None):
+    """Remove the digit of every solved box from the masks of its peers."""
+    peers = solution.topology(variant).peer_indexes
+    for i in range(len(board)):
+        mask = board[i]
+        if POPCOUNT[mask] == 1:
+            keep = ~mask
+            for p in peers[i]:
+                board[p] &= keep
+    return board
+
+
+def only_choice(board, variant=None):
+    """Assign every digit that fits in exactly one box of a unit to that box."""
+    for unit in solution.topology(variant).unit_indexes:
+        once = twice = 0
+        for i in unit:
+            mask = board[i]
+            twice |= once & mask
+            once |= mask
+        once &= ~twice
+        if once:
+            for i in unit:
+                mask = board[i] & once
+                if mask:
+                    # two hidden singles in one box is a contradiction; keep the lowest
+                    # digit like the dictionary version does and let it surface later
+                    board[i] = mask & -mask
+    return board
+
+
+def naked_twins(board, variant=None):
+    """Eliminate the candidates of naked twins from the rest of their unit.
+
+    Same semantics as solution.naked_twins: each unit is scanned once with
+    its two-candidate boxes bucketed by mask, and a mask held by exactly two
+    boxes is removed from the other unsolved boxes of the unit.
+    """
+    for unit in solution.topology(variant).unit_indexes:
+        pairs = {}
+        for i in unit:
+            mask = board[i]
+            if POPCOUNT[mask] == 2:
+                pairs.setdefault(mask, []).append(i)
+        for mask, twins in pairs.items():
+            if len(twins) != 2:
+                continue
+            keep = ~mask
+            for i in unit:
+                if POPCOUNT[board[i]] > 1 and i not in twins:
+                    board[i] &= keep
+    return board
+
+
+def propagate(board, changed, trail=None, variant=None):
+    """Run eliminate, only choice and naked twins outward from the boxes that changed.
+
+    Works off a queue instead of rescanning the board: a box whose mask
+    changed gets its units marked dirty, and if it is solved its digit is
+    removed from its peers, which may queue those peers in turn. Dirty units
+    are then checked for hidden singles and naked twins. Stops as soon as a
+    box runs out of candidates or a unit has nowhere left to put a digit.
+
+    Args:
+        board(list): 81 candidate masks, updated in place.
+        changed(iterable): indexes of the boxes to start from.
+        trail(list): if given, every overwritten (index, old mask) is appended
+            so the caller can undo() back to an earlier length.
+        variant: the Variant (or its name) the board belongs to.
+    Returns:
+        the board at the fixpoint, or False on a contradiction.
+    """
+    topo = solution.topology(variant)
+    popcount = POPCOUNT
+    peers = topo.peer_indexes
+    units = topo.unit_indexes
+    units_of = topo.units_of
+    queue = list(changed)
+    dirty = set()
+    record = trail.append if trail is not None else None
+    while True:
+        while queue:
+            i = queue.pop()
+            mask = board[i]
+            dirty.update(units_of[i])
+            if popcount[mask] == 1:
+                for p in peers[i]:
+                    m = board[p]
+                    if m & mask:
+                        m &= ~mask
+                        if not m:
+                            return False
+                        if record:
+                            record((p, board[p]))
+                        board[p] = m
+                        queue.append(p)
+        if not dirty:
+            return board
+        unit = units[dirty.pop()]
+        once = twice = 0
+        for i in unit:
+            mask = board[i]
+            twice |= once & mask
+            once |= mask
+        if once != ALL:
+            return False  # some digit has no box left in this unit
+        once &= ~twice
+        if once:
+            for i in unit:
+                mask = board[i]
+                m = mask & once
+                if m and m != mask:
+                    if popcount[m] > 1:
+                        return False  # two digits can only go in this one box
+                    if record:
+                        record((i, mask))
+                    board[i] = m
+                    queue.append(i)
+        if queue:
+            continue
+        # naked twins: two boxes of the unit left with the same two digits
+        seen = {}
+        for i in unit:
+            mask = board[i]
+            if popcount[mask] == 2:
+                if mask not in seen:
+                    seen[mask] = i
+                    continue
+                twin = seen[mask]
+                for j in unit:
+                    m = board[j]
+                    if j != i and j != twin and m & mask:
+                        m &= ~mask
+                        if not m:
+                            return False
+                        if record:
+                            record((j, board[j]))
+                        board[j] = m
+                        queue.append(j)
+
+
+def reduce_puzzle(board, variant=None):
+    """Propagate eliminate(), only_choice() and naked_twins() over the whole board to a fixpoint.
+
+    Returns:
+        the reduced board, or False if some box has no candidates left.
+    """
+    if 0 in board:
+        return False
+    return propagate(board, range(len(board)), variant=variant)
+
+
+def undo(board, trail, mark):
+    """Restore every box changed since the trail was `mark` entries long."""
+    while len(trail) > mark:
+        i, mask = trail.pop()
+        board[i] = mask
+
+
+def select_box(board):
+    """Return the unsolved box with the fewest candidates (lowest index on ties), or -1 if solved."""
+    popcount = POPCOUNT
+    best, fewest = -1, 10
+    for i, mask in enumerate(board):
+        n = popcount[mask]
+        if 1 < n < fewest:
+            best, fewest = i, n
+            if n == 2:
+                break
+    return best
+
+
+def search(board, variant=None):
+    """Depth-first search with propagation, trying the box with fewest candidates first.
+
+    The search is iterative and works on the one board in place: every change
+    made while trying a digit goes on an undo trail, and backtracking pops the
+    trail instead of throwing away a copied board. Memory is bounded by the
+    search depth rather than the number of nodes visited, and deep searches
+    do not touch the recursion limit.
+
+    Args:
+        board(list): 81 candidate masks, updated in place.
+        variant: the Variant (or its name) the board belongs to.
+    Returns:
+        the solved board, or False if there is no solution.
+    """
+    variant = solution.topology(variant)
+    if reduce_puzzle(board, variant) is False:
+        return False
+    trail = []
+    stack = []  # one [box, untried digits, trail mark] frame per branch point
+    s = select_box(board)
+    while s >= 0:
+        stack.append([s, board[s], len(trail)])
+        while stack:
+            frame = stack[-1]
+            s, untried, mark = frame
+            undo(board, trail, mark)
+            if not untried:
+                stack.pop()
+                continue
+            bit = untried & -untried
+            frame[1] = untried ^ bit
+            trail.append((s, board[s]))
+            board[s] = bit
+            if propagate(board, (s,), trail, variant) is not False:
+                break
+        else:
+            return False
+        s = select_box(board)
+    return board  # Solved!
+
+
+def solve(grid, variant=None):
+    """Bitmask counterpart of solution.solve, returning the dictionary form or False."""
+    variant = solution.topology(variant)
+    return to_values(search(grid_board(grid, variant), variant), variant)
@@ -0,0 +1,28 @@
+import bitboard
+import solution
+import solution_test
+import unittest
+
+
+class TestBitboard(unittest.TestCase):
+    hard_grid = '4.....8.5.3..........7......2.....6.....8.4......1.......6.3.7.5..2.....1.4......'
+
+    def test_round_trip(self):
+        values = solution.grid_values(self.hard_grid)
+        self.assertEqual(bitboard.to_values(bitboard.from_values(values)), values)
+        self.assertEqual(bitboard.grid_board(self.hard_grid), bitboard.from_values(values))
+
+    def test_naked_twins(self):
+        cases = solution_test.TestNakedTwins
+        board = bitboard.from_values(cases.before_naked_twins_1)
+        self.assertTrue(bitboard.to_values(bitboard.naked_twins(board)) in cases.possible_solutions_1)
+        board = bitboard.from_values(cases.before_naked_twins_2)
+        self.assertTrue(bitboard.to_values(bitboard.naked_twins(board)) in cases.possible_solutions_2)
+
+    def test_search_matches_dict_engine(self):
+        expected = solution.search(solution.grid_values(self.hard_grid))
+        self.assertEqual(bitboard.to_values(bitboard.search(bitboard.grid_board(self.hard_grid))), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
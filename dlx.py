@@ -0,0 +1,197 @@
+"""Dancing Links (Algorithm X) exact cover solver backend.
+
+Sudoku is encoded as an exact cover problem: one row per (box, digit)
+placement and one column per constraint, and a solution picks one row for
+every box. Every unit of the variant adds a "digit d appears once in this
+unit" column per digit, so extra units such as the diagonals of the diagonal
+variant are handled the same way as rows, columns and squares.
+
+The links are kept in flat integer lists (left, right, up, down, column)
+rather than node objects, which keeps covering and uncovering to a handful
+of list index operations.
+"""
+import solution
+
+
+class DancingLinks(object):
+    """Exact cover matrix with dancing links.
+
+    Args:
+        columns(int): number of constraint columns.
+        rows(iterable): each row is a sequence of column indexes it covers.
+    """
+
+    def __init__(self, columns, rows):
+        # node 0 is the root, nodes 1..columns are the column headers
+        n = columns + 1
+        self.left = [i - 1 for i in range(n)]
+        self.right = [i + 1 for i in range(n)]
+        self.left[0] = columns
+        self.right[columns] = 0
+        self.up = list(range(n))
+        self.down = list(range(n))
+        self.column = list(range(n))
+        self.size = [0] * n
+        self.row_of = [-1] * n
+        self.row_start = []
+        for r, cols in enumerate(rows):
+            self.row_start.append(len(self.up))
+            first = None
+            for c in cols:
+                c += 1
+                node = len(self.up)
+                self.column.append(c)
+                self.row_of.append(r)
+                self.up.append(self.up[c])
+                self.down.append(c)
+                self.down[self.up[c]] = node
+                self.up[c] = node
+                self.size[c] += 1
+                if first is None:
+                    first = node
+                    self.left.append(node)
+                    self.right.append(node)
+                else:
+                    self.left.append(self.left[first])
+                    self.right.append(first)
+                    self.right[self.left[first]] = node
+                    self.left[first] = node
+
+    def cover(self, c):
+        left, right, up, down, column, size = self.left, self.right, self.up, self.down, self.column, self.size
+        right[left[c]] = right[c]
+        left[right[c]] = left[c]
+        i = down[c]
+        while i != c:
+            j = right[i]
+            while j != i:
+                down[up[j]] = down[j]
+                up[down[j]] = up[j]
+                size[column[j]] -= 1
+                j = right[j]
+            i = down[i]
+
+    def uncover(self, c):
+        left, right, up, down, column, size = self.left, self.right, self.up, self.down, self.column, self.size
+        i = up[c]
+        while i != c:
+            j = left[i]
+            while j != i:
+                size[column[j]] += 1
+                down[up[j]] = j
+                up[down[j]] = j
+                j = left[j]
+            i = up[i]
+        right[left[c]] = c
+        left[right[c]] = c
+
+    def select(self, r_node):
+        """Cover the columns of the row containing node r_node (used for givens)."""
+        j = r_node
+        while True:
+            self.cover(self.column[j])
+            j = self.right[j]
+            if j == r_node:
+                break
+
+    def solve(self):
+        """Return the list of chosen rows of the first exact cover found, or None.
+
+        Iterative Algorithm X, always branching on the column with the fewest rows.
+        """
+        right, down, column, size, row_of = self.right, self.down, self.column, self.size, self.row_of
+        chosen = []
+        stack = []  # nodes of the rows tried at each level
+        while True:
+            if right[0] == 0:
+                return [row_of[node] for node in chosen]
+            # choose the column with the fewest rows left
+            c = right[0]
+            best, fewest = c, size[c]
+            while c != 0 and fewest > 1:
+                if size[c] < fewest:
+                    best, fewest = c, size[c]
+                c = right[c]
+            self.cover(best)
+            node = down[best]
+            # try rows of this column, backtracking through the stack when one runs out
+            while node == column[node]:
+                self.uncover(column[node])
+                if not stack:
+                    return None
+                node = stack.pop()
+                chosen.pop()
+                j = self.left[node]
+                while j != node:
+                    self.uncover(column[j])
+                    j = self.left[j]
+                node = down[node]
+            stack.append(node)
+            chosen.append(node)
+            j = right[node]
+            while j != node:
+                self.cover(column[j])
+                j = right[j]
+
+
+def sudoku_matrix(variant):
+    """Build the exact cover rows for a sudoku variant.
+
+    Returns:
+        (number of columns, rows, placements) where placements[r] is the
+        (box, digit) a row stands for.
+    """
+    boxes = variant.boxes
+    unitlist = variant.unitlist
+    n = len(variant.digits)
+    box_column = dict((box, i) for i, box in enumerate(boxes))
+    unit_base = len(boxes)
+    units_of = dict((box, []) for box in boxes)
+    for u, unit in enumerate(unitlist):
+        for box in unit:
+            units_of[box].append(u)
+    rows = []
+    placements = []
+    for box in boxes:
+        for d, digit in enumerate(variant.digits):
+            cols = [box_column[box]] + [unit_base + n * u + d for u in units_of[box]]
+            rows.append(cols)
+            placements.append((box, digit))
+    return unit_base + n * len(unitlist), rows, placements
+
+
+# the matrix only depends on the variant, so it is built once per variant
+_matrices = {}
+
+
+def solve(grid, variant=None):
+    """Solve a grid string with Dancing Links, returning the dictionary form or False."""
+    variant = solution.topology(variant)
+    if variant not in _matrices:
+        columns, rows, placements = sudoku_matrix(variant)
+        _matrices[variant] = columns, rows, placements, dict((p, r) for r, p in enumerate(placements))
+    columns, rows, placements, row_index = _matrices[variant]
+    values = solution.grid_values(grid, variant)
+    links = DancingLinks(columns, rows)
+    given = []
+    for box in variant.boxes:
+        if len(values[box]) == 1:
+            r = row_index[(box, values[box])]
+            node = links.row_start[r]
+            # a given whose columns are already covered clashes with an earlier given
+            j = node
+            while True:
+                if links.right[links.left[links.column[j]]] != links.column[j]:
+                    return False
+                j = links.right[j]
+                if j == node:
+                    break
+            links.select(node)
+            given.append(r)
+    chosen = links.solve()
+    if chosen is None:
+        return False
+    for r in given + chosen:
+        box, digit = placements[r]
+        values[box] = digit
+    return values
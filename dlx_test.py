@@ -0,0 +1,24 @@
+import dlx
+import solution
+import unittest
+
+
+class TestDancingLinks(unittest.TestCase):
+    hard_grid = '8..........36......7..9.2...5...7.......457.....1...3...1....68..85...1..9....4..'
+
+    def test_matches_search(self):
+        expected = solution.search(solution.grid_values(self.hard_grid))
+        self.assertEqual(solution.solve(self.hard_grid, backend='dlx'), expected)
+
+    def test_clashing_givens(self):
+        self.assertFalse(dlx.solve('11' + '.' * 79))
+
+    def test_exact_cover(self):
+        # rows {0, 2}, {1}, {0, 1} over 3 columns: the only cover is rows 0 and 1
+        links = dlx.DancingLinks(3, [[0, 2], [1], [0, 1]])
+        self.assertEqual(sorted(links.solve()), [0, 1])
+        self.assertIsNone(dlx.DancingLinks(2, [[0], [0]]).solve())
+
+
+if __name__ == '__main__':
+    unittest.main()
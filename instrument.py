@@ -0,0 +1,127 @@
+"""Optional instrumentation for a single solve.
+
+Nothing in here is active unless a solve is handed one of these objects, so
+the solving code only pays for a `None` check when it is switched off.
+"""
+import collections
+import logging
+
+
+class Recorder(object):
+    """Records every change assign_value makes during a solve as a (box, old, new) delta.
+
+    Deltas are compact compared to full board snapshots, and `maxlen` turns
+    the history into a ring buffer that keeps only the most recent changes.
+    The board as it was before the oldest kept delta is tracked as `start`,
+    so the kept history can always be replayed.
+
+    Args:
+        maxlen(int): number of deltas to keep, None to keep all of them.
+    """
+
+    def __init__(self, maxlen=None):
+        self.maxlen = maxlen
+        self.start = None
+        self.current = None
+        self.deltas = collections.deque()
+        self.dropped = 0
+
+    def begin(self, values):
+        """Start a new history from the board `values`."""
+        self.start = dict(values)
+        self.current = dict(values)
+        self.deltas.clear()
+        self.dropped = 0
+
+    def record(self, box, old, new):
+        """Record that `box` changed from `old` to `new`."""
+        self.deltas.append((box, old, new))
+        self.current[box] = new
+        if self.maxlen is not None and len(self.deltas) > self.maxlen:
+            box, old, new = self.deltas.popleft()
+            self.start[box] = new
+            self.dropped += 1
+
+    def sync(self, values):
+        """Record whatever deltas turn the last recorded board into `values`.
+
+        Search backtracks by throwing boards away, so before it continues from
+        an earlier board the history is brought back in line with it.
+        """
+        current = self.current
+        for box, value in values.items():
+            if current[box] != value:
+                self.record(box, current[box], value)
+
+    def __len__(self):
+        return len(self.deltas)
+
+    def boards(self):
+        """Yield the board after each kept delta, starting with `start` itself."""
+        values = dict(self.start)
+        yield dict(values)
+        for box, old, new in self.deltas:
+            values[box] = new
+            yield dict(values)
+
+    def placements(self):
+        """Yield the board after each delta that leaves a box with a single digit.
+
+        These are the snapshots the visualizer replays.
+        """
+        values = dict(self.start)
+        for box, old, new in self.deltas:
+            values[box] = new
+            if len(new) == 1:
+                yield dict(values)
+
+
+class Tracer(object):
+    """Structured trace of a solve: strategy applications, eliminations and branch points.
+
+    Every event is a dict with an 'event' key, one of:
+        'strategy'  a strategy started a pass over the board ('name')
+        'eliminate' digits were removed from a box ('box', 'digits', 'strategy')
+        'assign'    a box was reduced to a single digit ('box', 'digit', 'strategy')
+        'branch'    search is trying a digit for a box ('box', 'digit', 'choices')
+    Events go to `sink` if one is given, otherwise they are kept in `events`.
+
+    Args:
+        sink(callable): called with each event dict.
+    """
+
+    def __init__(self, sink=None):
+        self.sink = sink
+        self.events = []
+        self.strategy = None
+
+    @classmethod
+    def to_logger(cls, logger, level=logging.DEBUG):
+        """A Tracer that logs each event, with the event dict attached as `record.trace`."""
+        def sink(event):
+            logger.log(level, '%(event)s %(fields)s', {'event': event['event'], 'fields': event},
+                       extra={'trace': event})
+        return cls(sink)
+
+    def emit(self, event, **fields):
+        fields['event'] = event
+        if self.sink is not None:
+            self.sink(fields)
+        else:
+            self.events.append(fields)
+
+    def start(self, name):
+        """Mark the start of a pass of strategy `name`; later changes are attributed to it."""
+        self.strategy = name
+        self.emit('strategy', name=name)
+
+    def change(self, box, old, new):
+        if len(new) == 1:
+            self.emit('assign', box=box, digit=new, strategy=self.strategy)
+        else:
+            removed = ''.join(d for d in old if d not in new)
+            self.emit('eliminate', box=box, digits=removed, strategy=self.strategy)
+
+    def branch(self, box, digit, choices):
+        self.strategy = 'search'
+        self.emit('branch', box=box, digit=digit, choices=choices)
@@ -0,0 +1,44 @@
+import instrument
+import solution
+import unittest
+
+
+class TestRecorder(unittest.TestCase):
+    grid = '5.9.2..1.4...56...8..9.3..5.87..25..654....82..15684971.82.5...7..68...3.4..7.8..'
+
+    def test_replay_matches_solve(self):
+        recorder = instrument.Recorder()
+        values = solution.solve(self.grid, recorder=recorder)
+        self.assertTrue(len(recorder) > 0)
+        self.assertEqual(list(recorder.boards())[-1], values)
+
+    def test_ring_buffer(self):
+        recorder = instrument.Recorder(maxlen=10)
+        values = solution.solve(self.grid, recorder=recorder)
+        self.assertEqual(len(recorder), 10)
+        self.assertTrue(recorder.dropped > 0)
+        self.assertEqual(list(recorder.boards())[-1], values)
+
+    def test_off_by_default(self):
+        solution.solve(self.grid)
+        self.assertIsNone(solution._recorder)
+
+
+class TestTracer(unittest.TestCase):
+    grid = TestRecorder.grid
+
+    def test_events(self):
+        tracer = instrument.Tracer()
+        solution.solve(self.grid, trace=tracer)
+        kinds = set(event['event'] for event in tracer.events)
+        self.assertTrue(set(['strategy', 'eliminate', 'assign']) <= kinds)
+        self.assertIsNone(solution._tracer)
+
+    def test_sink(self):
+        events = []
+        solution.solve(self.grid, trace=instrument.Tracer(events.append))
+        self.assertTrue(events)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+"""Streaming readers and writers for line oriented puzzle files.
+
+Files may be plain text, gzip (.gz) or bzip2 (.bz2) compressed. Plain files
+are memory mapped so only the pages being scanned are resident. Every reader
+is a generator yielding one puzzle at a time, so memory use does not depend
+on the size of the corpus.
+"""
+import bz2
+import gzip
+import mmap
+import os
+import sys
+
+# characters grid_values turns into boxes; anything else on a line is skipped
+GRID_CHARS = frozenset('.123456789')
+
+
+def is_valid_grid(line):
+    """Check a line against the grid_values rules without building a dict.
+
+    A grid is valid when it has exactly 81 characters that are either a digit
+    1-9 or '.'; any other characters are ignored, as grid_values does.
+    """
+    return sum(1 for c in line if c in GRID_CHARS) == 81
+
+
+def normalize_grid(line):
+    """Strip a valid grid line down to its 81 box characters."""
+    return ''.join(c for c in line if c in GRID_CHARS)
+
+
+def _open(path, mode):
+    if path.endswith('.gz'):
+        return gzip.open(path, mode + 't')
+    if path.endswith('.bz2'):
+        return bz2.open(path, mode + 't')
+    return open(path, mode)
+
+
+def _mapped_lines(path):
+    """Yield the lines of a plain file through a read-only memory map."""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            for line in iter(data.readline, b''):
+                yield line.decode('ascii', 'replace')
+
+
+def read_lines(path):
+    """Yield raw lines from a puzzle file, or stdin when path is '-'."""
+    if path == '-':
+        for line in sys.stdin:
+            yield line
+    elif path.endswith('.gz') or path.endswith('.bz2'):
+        with _open(path, 'r') as f:
+            for line in f:
+                yield line
+    else:
+        for line in _mapped_lines(path):
+            yield line
+
+
+def read_puzzles(path, errors='skip'):
+    """Lazily read puzzles from a line oriented file.
+
+    Blank lines and lines starting with '#' are ignored.
+
+    Args:
+        path(string): file path, '.gz'/'.bz2' are decompressed on the fly, '-' is stdin.
+        errors(string): 'skip' drops lines that are not valid grids, 'raise'
+            raises ValueError with the line number.
+    Yields:
+        81 character grid strings.
+    """
+    for number, line in enumerate(read_lines(path), 1):
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        if is_valid_grid(line):
+            yield normalize_grid(line)
+        elif errors == 'raise':
+            raise ValueError('%s:%d: not a valid sudoku grid: %r' % (path, number, line))
+
+
+class SolutionWriter(object):
+    """Write `puzzle,solution` lines incrementally to a (possibly compressed) file.
+
+    Usable as a context manager; every write goes straight to the underlying
+    file object, so nothing accumulates in memory.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.file = sys.stdout if path == '-' else _open(path, 'w')
+
+    def write(self, grid, solution):
+        """Write one result, solution being a grid string or a falsy value for no solution."""
+        self.file.write('%s,%s\n' % (grid, solution or '-'))
+
+    def close(self):
+        if self.file is not None and self.path != '-':
+            self.file.close()
+        self.file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -1,187 +1,141 @@
 import sys
 import logging
-logging.basicConfig(filename='solution.log', level=logging.DEBUG)
+from itertools import combinations
 
-assignments = []
+from instrument import Recorder, Tracer
+from variant import CLASSIC, DIAGONAL, cross, get_variant
 
-rows = 'ABCDEFGHI'
-cols = '123456789'
-cols_rev = cols[::-1]
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
-# Set true if diagonal game
+# Recorder and Tracer for the solve in progress, see solve(recorder=..., trace=...)
+_recorder = None
+_tracer = None
+
+# Set true if diagonal game; picks the variant solved when none is passed in
 is_diagonal = False
+default_variant = DIAGONAL if is_diagonal else CLASSIC
+
+
+def topology(variant=None):
+    """Return the Variant to solve with: the default one, or `variant` looked up by name."""
+    return default_variant if variant is None else get_variant(variant)
 
 
 def assign_value(values, box, value):
     """
     Please use this function to update your values dictionary!
-    Assigns a value to a given box. If it updates the board record it.
+    Assigns a value to a given box. If it updates the board and a recorder or
+    tracer is attached to the current solve, the change is recorded.
     """
 
-    # Don't waste memory appending actions that don't actually change any values
+    # Don't waste memory recording actions that don't actually change any values
     if values[box] == value:
         return values
 
+    if _recorder is not None:
+        _recorder.record(box, values[box], value)
+    if _tracer is not None:
+        _tracer.change(box, values[box], value)
     values[box] = value
-    if len(value) == 1:
-        assignments.append(values.copy())
     return values
 
 
-def naked_twins(values):
+def naked_twins(values, variant=None):
     """Eliminate values using the naked twins strategy.
+
+    Each unit is scanned once: its two-digit boxes are bucketed by their
+    digits, and any pair of digits held by exactly two boxes of the unit is
+    removed from the other unsolved boxes of that unit.
+
     Args:
         values(dict): a dictionary of the form {'box_name': '123456789', ...}
+        variant: the Variant (or its name) whose units to use, the default one if None.
 
     Returns:
         the values dictionary with the naked twins eliminated from peers.
     """
-
-    display(values)
-    # Find all instances of naked twins
-    # Get a list of boxes with same value length and length 2.
-    length2boxes = [box for box in values.keys() if len(values[box]) == 2]
-
-    # get all peers with equal value to form our twins list
-    twins = [[box1, box2] for box1 in length2boxes
-             for box2 in peers[box1]
-             if set(values[box1]) == set(values[box2])]
-
-    # print("twins: " + str(twins))
-    # get a distinct list of twins to remove from future peer lists
-    twinlist = list()
-    for box1, box2 in twins:
-        twinlist.append(box1)
-        twinlist.append(box2)
-        twinlist = list(set(twinlist))
-
-    # print("twins list: " + str(twinlist))
-
-    # Process each twin removing peer values
-    for i in range(len(twins)):
-        box1 = twins[i][0]
-        box2 = twins[i][1]
-
-        # print("box1: " + str(box1))
-        # print("box2: " + str(box2))
-
-        # Get the union of peers using set objects
-        peers1 = set(peers[box1])
-        peers2 = set(peers[box2])
-        peers_int = peers1.intersection(peers2)
-
-        # print("peers list: " + str(peers_int))
-
-        # remove original twins from combined set of peers
-        # for box in twinlist:
-        #     if box in peers_int:
-        #         peers_int.remove(box)
-
-        # print("peers list no twins: " + str(peers_int))
-
-        # Iterate through the intersection and remove twin values from each
-        for peer in peers_int:
-            digits = values[box1]
-
-            for digit in digits:
-
-                if len(values[peer]) > 1:
-                    values[peer] = values[peer].replace(digit, '')
-                    assign_value(values, peer, values[peer].replace(digit, ''))
-
-    # display(values)
-    # display({'G7': '6', 'G6': '3', 'G5': '2', 'G4': '9', 'G3': '1', 'G2': '8', 'G1': '7', 'G9': '5', 'G8': '4', 'C9': '1',
-    #      'C8': '5', 'C3': '8', 'C2': '237', 'C1': '23', 'C7': '9', 'C6': '6', 'C5': '37', 'A4': '2357', 'A9': '8',
-    #      'A8': '6', 'F1': '6', 'F2': '4', 'F3': '23', 'F4': '1235', 'F5': '8', 'F6': '125', 'F7': '35', 'F8': '9',
-    #      'F9': '7', 'B4': '27', 'B5': '1', 'B6': '8', 'B7': '27', 'E9': '2', 'B1': '9', 'B2': '5', 'B3': '6', 'C4': '4',
-    #      'B8': '3', 'B9': '4', 'I9': '9', 'I8': '7', 'I1': '23', 'I3': '23', 'I2': '6', 'I5': '5', 'I4': '8', 'I7': '1',
-    #      'I6': '4', 'A1': '1', 'A3': '4', 'A2': '237', 'A5': '9', 'E8': '1', 'A7': '27', 'A6': '257', 'E5': '347',
-    #      'E4': '6', 'E7': '345', 'E6': '579', 'E1': '8', 'E3': '79', 'E2': '37', 'H8': '2', 'H9': '3', 'H2': '9',
-    #      'H3': '5', 'H1': '4', 'H6': '17', 'H7': '8', 'H4': '17', 'H5': '6', 'D8': '8', 'D9': '6', 'D6': '279',
-    #      'D7': '34', 'D4': '237', 'D5': '347', 'D2': '1', 'D3': '79', 'D1': '5'})
-    # display({'I6': '4', 'H9': '3', 'I2': '6', 'E8': '1', 'H3': '5', 'H7': '8', 'I7': '1', 'I4': '8', 'H5': '6', 'F9': '7',
-    #      'G7': '6', 'G6': '3', 'G5': '2', 'E1': '8', 'G3': '1', 'G2': '8', 'G1': '7', 'I1': '23', 'C8': '5', 'I3': '23',
-    #      'E5': '347', 'I5': '5', 'C9': '1', 'G9': '5', 'G8': '4', 'A1': '1', 'A3': '4', 'A2': '237', 'A5': '9',
-    #      'A4': '2357', 'A7': '27', 'A6': '257', 'C3': '8', 'C2': '237', 'C1': '23', 'E6': '579', 'C7': '9', 'C6': '6',
-    #      'C5': '37', 'C4': '4', 'I9': '9', 'D8': '8', 'I8': '7', 'E4': '6', 'D9': '6', 'H8': '2', 'F6': '125',
-    #      'A9': '8', 'G4': '9', 'A8': '6', 'E7': '345', 'E3': '79', 'F1': '6', 'F2': '4', 'F3': '23', 'F4': '1235',
-    #      'F5': '8', 'E2': '3', 'F7': '35', 'F8': '9', 'D2': '1', 'H1': '4', 'H6': '17', 'H2': '9', 'H4': '17',
-    #      'D3': '79', 'B4': '27', 'B5': '1', 'B6': '8', 'B7': '27', 'E9': '2', 'B1': '9', 'B2': '5', 'B3': '6',
-    #      'D6': '279', 'D7': '34', 'D4': '237', 'D5': '347', 'B8': '3', 'B9': '4', 'D1': '5'})
-
+    if _tracer is not None:
+        _tracer.start('naked_twins')
+    for unit in topology(variant).unitlist:
+        # bucket the boxes with two possible values by those values
+        pairs = {}
+        for box in unit:
+            if len(values[box]) == 2:
+                pairs.setdefault(values[box], []).append(box)
+
+        for digits, twins in pairs.items():
+            if len(twins) != 2:
+                continue
+            # remove the twin values from every other box in the unit
+            for box in unit:
+                value = values[box]
+                if len(value) > 1 and box not in twins:
+                    assign_value(values, box, ''.join(d for d in value if d not in digits))
     return values
 
 
-def cross(A, B):
-    """ Cross product of elements in A and elements in B. """
-    return [s + t for s in A for t in B]
-
+# tables of the default variant under their original module level names
+rows = default_variant.rows
+cols = default_variant.cols
+boxes = default_variant.boxes
+row_units = default_variant.row_units
+column_units = default_variant.column_units
+square_units = default_variant.square_units
+unitlist = default_variant.unitlist
+units = default_variant.units
+peers = default_variant.peers
 
-# initial setup of environment
-# all possible boxes on the board
-boxes = cross(rows, cols)
-# print(boxes)
 
-# all possible rows on the board
-row_units = [cross(r, cols) for r in rows]
-
-# all possible columns on the board
-column_units = [cross(rows, c) for c in cols]
-
-# all possible boxes on the board (should be 9)
-square_units = [cross(rs, cs) for rs in ('ABC', 'DEF', 'GHI') for cs in ('123', '456', '789')]
-
-# have to calculate the diagonal units for a diagonal game
-units1 = [[rows[i] + cols[i] for i in range(len(rows))]]
-units2 = [[rows[i] + cols_rev[i] for i in range(len(rows))]]
-
-if is_diagonal:
-    unitlist = row_units + column_units + square_units + units1 + units2
-else:
-    unitlist = row_units + column_units + square_units
-
-units = dict((s, [u for u in unitlist if s in u]) for s in boxes)
-peers = dict((s, set(sum(units[s], [])) - set([s])) for s in boxes)
-
-
-def grid_values(grid):
+def grid_values(grid, variant=None):
     """Convert grid string into {<box>: <value>} dict with '123456789' value for empties.
 
     Args:
         grid: Sudoku grid in string form, 81 characters long
+        variant: the Variant (or its name) the grid belongs to, the default one if None.
     Returns:
         Sudoku grid in dictionary form:
         - keys: Box labels, e.g. 'A1'
         - values: Value in corresponding box, e.g. '8', or '123456789' if it is empty.
     """
+    topo = topology(variant)
     values = []
-    all_digits = '123456789'
+    all_digits = topo.digits
     for c in grid:
         if c == '.':
             values.append(all_digits)
         elif c in all_digits:
             values.append(c)
-    assert len(values) == 81
-    return dict(zip(boxes, values))
+    assert len(values) == len(topo.boxes)
+    return dict(zip(topo.boxes, values))
+
 
+def values_to_grid(values, variant=None):
+    """Convert a sudoku in dictionary form back into an 81 character grid string.
 
-def display(values):
+    Boxes that are not down to a single digit are written as '.'.
+    """
+    return ''.join(values[s] if len(values[s]) == 1 else '.' for s in topology(variant).boxes)
+
+
+def display(values, variant=None):
     """
     Display the values as a 2-D grid.
-    Input: The sudoku in dictionary form
+    Input: The sudoku in dictionary form, and optionally its variant
     Output: None
     """
-    width = 1 + max(len(values[s]) for s in boxes)
+    topo = topology(variant)
+    width = 1 + max(len(values[s]) for s in topo.boxes)
     line = '+'.join(['-' * (width * 3)] * 3)
-    for r in rows:
+    for r in topo.rows:
         print(''.join(values[r + c].center(width) + ('|' if c in '36' else '')
-                      for c in cols))
+                      for c in topo.cols))
         if r in 'CF': print(line)
     print("\n")
     return
 
 
-def eliminate(values):
+def eliminate(values, variant=None):
     """Eliminate values from peers of each box with a single value.
 
         Go through all the boxes, and whenever there is a box with a single value,
@@ -189,94 +143,341 @@ def eliminate(values):
 
         Args:
             values: Sudoku in dictionary form.
+            variant: the Variant (or its name) whose peers to use, the default one if None.
         Returns:
             Resulting Sudoku in dictionary form after eliminating values.
         """
+    if _tracer is not None:
+        _tracer.start('eliminate')
+    peers = topology(variant).peers
     solved_values = [box for box in values.keys() if len(values[box]) == 1]
     for box in solved_values:
         digit = values[box]
         for peer in peers[box]:
-            values[peer] = values[peer].replace(digit, '')
             assign_value(values, peer, values[peer].replace(digit, ''))
     return values
 
 
-def only_choice(values):
+def only_choice(values, variant=None):
     """Finalize all values that are the only choice for a unit.
 
         Go through all the units, and whenever there is a unit with a value
         that only fits in one box, assign the value to this box.
 
-        Input: Sudoku in dictionary form.
+        Input: Sudoku in dictionary form, and optionally its variant.
         Output: Resulting Sudoku in dictionary form after filling in only choices.
         """
-    for unit in unitlist:
-        for digit in '123456789':
+    if _tracer is not None:
+        _tracer.start('only_choice')
+    topo = topology(variant)
+    for unit in topo.unitlist:
+        for digit in topo.digits:
             dplaces = [box for box in unit if digit in values[box]]
             if len(dplaces) == 1:
                 assign_value(values, dplaces[0], digit)
-                values[dplaces[0]] = digit
     return values
 
 
-def reduce_puzzle(values):
+def _remove_digits(values, box, digits):
+    """Remove every digit in `digits` from the possible values of box."""
+    value = values[box]
+    remaining = ''.join(d for d in value if d not in digits)
+    if remaining != value:
+        assign_value(values, box, remaining)
+
+
+def _naked_subsets(values, n, topo):
+    """In each unit, n unsolved boxes that between them hold only n digits claim those digits."""
+    for unit in topo.unitlist:
+        open_boxes = [box for box in unit if 1 < len(values[box]) <= n]
+        if len(open_boxes) <= n:
+            continue
+        for subset in combinations(open_boxes, n):
+            digits = set(''.join(values[box] for box in subset))
+            if len(digits) != n:
+                continue
+            for box in unit:
+                if box not in subset and len(values[box]) > 1:
+                    _remove_digits(values, box, digits)
+    return values
+
+
+def _hidden_subsets(values, n, topo):
+    """In each unit, n digits that only fit in the same n boxes rule out every other digit there."""
+    for unit in topo.unitlist:
+        places = {}
+        for digit in topo.digits:
+            dplaces = [box for box in unit if digit in values[box]]
+            if 1 < len(dplaces) <= n:
+                places[digit] = dplaces
+        if len(places) < n:
+            continue
+        for subset in combinations(sorted(places), n):
+            boxes_used = set(box for digit in subset for box in places[digit])
+            if len(boxes_used) != n:
+                continue
+            for box in boxes_used:
+                _remove_digits(values, box, set(values[box]) - set(subset))
+    return values
+
+
+def _intersection_removal(values, claiming_units, other_units, topo):
+    """When a digit's places in one unit all lie in its overlap with another, remove it from the rest of the other."""
+    for unit in claiming_units:
+        for digit in topo.digits:
+            dplaces = set(box for box in unit if digit in values[box])
+            if len(dplaces) < 2:
+                continue
+            for other in other_units:
+                if dplaces <= set(other):
+                    for box in other:
+                        if box not in dplaces and digit in values[box]:
+                            _remove_digits(values, box, digit)
+    return values
+
+
+def _fish(values, n, topo):
+    """X-wing (n=2) and swordfish (n=3) on rows and columns.
+
+    If a digit's places in n rows all fall within n columns, the digit must
+    take those columns in those rows and can be removed from the rest of the
+    columns. The same holds with rows and columns swapped.
+    """
+    for base, cover in ((topo.row_units, topo.column_units), (topo.column_units, topo.row_units)):
+        for digit in topo.digits:
+            lines = []
+            for unit in base:
+                dplaces = [box for box in unit if digit in values[box]]
+                if 1 < len(dplaces) <= n:
+                    lines.append((unit, set(i for i, c in enumerate(cover) if any(box in c for box in dplaces))))
+            for subset in combinations(lines, n):
+                covered = set().union(*[indexes for unit, indexes in subset])
+                if len(covered) != n:
+                    continue
+                inside = set(box for unit, indexes in subset for box in unit)
+                for i in covered:
+                    for box in cover[i]:
+                        if box not in inside and digit in values[box] and len(values[box]) > 1:
+                            _remove_digits(values, box, digit)
+    return values
+
+
+def naked_triples(values, variant=None):
+    """Eliminate the digits of naked triples from the rest of their unit."""
+    if _tracer is not None:
+        _tracer.start('naked_triples')
+    return _naked_subsets(values, 3, topology(variant))
+
+
+def naked_quads(values, variant=None):
+    """Eliminate the digits of naked quads from the rest of their unit."""
+    if _tracer is not None:
+        _tracer.start('naked_quads')
+    return _naked_subsets(values, 4, topology(variant))
+
+
+def hidden_pairs(values, variant=None):
+    """Strip every other digit from boxes holding a hidden pair."""
+    if _tracer is not None:
+        _tracer.start('hidden_pairs')
+    return _hidden_subsets(values, 2, topology(variant))
+
+
+def hidden_triples(values, variant=None):
+    """Strip every other digit from boxes holding a hidden triple."""
+    if _tracer is not None:
+        _tracer.start('hidden_triples')
+    return _hidden_subsets(values, 3, topology(variant))
+
+
+def pointing_pairs(values, variant=None):
+    """A digit confined to one row or column within a square is removed from the rest of that row or column."""
+    if _tracer is not None:
+        _tracer.start('pointing_pairs')
+    topo = topology(variant)
+    return _intersection_removal(values, topo.square_units, topo.row_units + topo.column_units, topo)
+
+
+def box_line_reduction(values, variant=None):
+    """A digit confined to one square within a row or column is removed from the rest of that square."""
+    if _tracer is not None:
+        _tracer.start('box_line_reduction')
+    topo = topology(variant)
+    return _intersection_removal(values, topo.row_units + topo.column_units, topo.square_units, topo)
+
+
+def x_wing(values, variant=None):
+    """Eliminate values using the X-wing strategy."""
+    if _tracer is not None:
+        _tracer.start('x_wing')
+    return _fish(values, 2, topology(variant))
+
+
+def swordfish(values, variant=None):
+    """Eliminate values using the swordfish strategy."""
+    if _tracer is not None:
+        _tracer.start('swordfish')
+    return _fish(values, 3, topology(variant))
+
+
+class Strategy(object):
+    """A deduction strategy reduce_puzzle can run.
+
+    Args:
+        name(string): name used to look up and toggle the strategy.
+        function(callable): called with a sudoku in dictionary form and the Variant,
+            returns the sudoku.
+        cost(int): relative cost; cheaper strategies are tried first.
+        enabled(bool): whether reduce_puzzle runs it by default.
+    """
+
+    def __init__(self, name, function, cost, enabled=True):
+        self.name = name
+        self.function = function
+        self.cost = cost
+        self.enabled = enabled
+
+
+# Strategies reduce_puzzle runs, keyed by name. Cheaper strategies are tried
+# first and reduce_puzzle goes back to the cheapest one whenever a strategy
+# removes something, so the expensive ones only run when the cheap ones are stuck.
+strategies = dict((s.name, s) for s in [
+    Strategy('eliminate', eliminate, 1),
+    Strategy('only_choice', only_choice, 2),
+    Strategy('naked_twins', naked_twins, 3),
+    Strategy('pointing_pairs', pointing_pairs, 4),
+    Strategy('box_line_reduction', box_line_reduction, 5),
+    Strategy('hidden_pairs', hidden_pairs, 6),
+    Strategy('naked_triples', naked_triples, 7),
+    Strategy('hidden_triples', hidden_triples, 8),
+    Strategy('x_wing', x_wing, 9),
+    Strategy('naked_quads', naked_quads, 10),
+    Strategy('swordfish', swordfish, 11),
+])
+
+
+def register_strategy(name, function, cost, enabled=True):
+    """Add a strategy for reduce_puzzle to run, or replace the one with the same name."""
+    strategies[name] = Strategy(name, function, cost, enabled)
+
+
+def enable_strategy(name, enabled=True):
+    """Switch a registered strategy on or off."""
+    strategies[name].enabled = enabled
+
+
+def active_strategies(names=None):
+    """The strategies to run, cheapest first: the enabled ones, or exactly those in `names`."""
+    if names is None:
+        selected = [s for s in strategies.values() if s.enabled]
+    else:
+        selected = [strategies[name] for name in names]
+    return sorted(selected, key=lambda s: s.cost)
+
+
+def reduce_puzzle(values, names=None, variant=None):
     """
-        Iterate eliminate() and only_choice(). If at some point, there is a box with no available values, return False.
+        Apply the registered strategies, cheapest first, until none of them can remove anything.
+        Whenever a strategy makes progress start again from the cheapest one.
+        If at some point, there is a box with no available values, return False.
         If the sudoku is solved, return the sudoku.
-        If after an iteration of both functions, the sudoku remains the same, return the sudoku.
-        Input: A sudoku in dictionary form.
+        Input: A sudoku in dictionary form, optionally the names of the strategies to use
+            instead of the enabled ones, and its variant.
         Output: The resulting sudoku in dictionary form.
         """
-    stalled = False
-    while not stalled:
-        # Check how many boxes have a determined value
-        solved_values_before = len([box for box in values.keys() if len(values[box]) == 1])
-        # Use the Eliminate Strategy
-        values = eliminate(values)
-        # Use the Only Choice Strategy
-        values = only_choice(values)
-        # Check how many boxes have a determined value, to compare
-        solved_values_after = len([box for box in values.keys() if len(values[box]) == 1])
-        # If no new values were added, stop the loop.
-        stalled = solved_values_before == solved_values_after
+    active = active_strategies(names)
+    topo = topology(variant)
+    # Count the possible values left on the board; strategies only ever remove them
+    candidates = sum(len(v) for v in values.values())
+    i = 0
+    while i < len(active):
+        values = active[i].function(values, topo)
         # Sanity check, return False if there is a box with zero available values:
-        if len([box for box in values.keys() if len(values[box]) == 0]):
+        if any(len(v) == 0 for v in values.values()):
             return False
+        # Count again, to compare
+        remaining = sum(len(v) for v in values.values())
+        if remaining < candidates:
+            candidates = remaining
+            i = 0
+        else:
+            i += 1
     return values
 
 
-def search(values):
+def search(values, variant=None):
     """Using depth-first search and propagation, try all possible values."""
+    topo = topology(variant)
     # First, reduce the puzzle using the previous function
-    values = reduce_puzzle(values)
+    values = reduce_puzzle(values, variant=topo)
     if values is False:
         return False  # Failed earlier
-    if all(len(values[s]) == 1 for s in boxes):
+    if all(len(values[s]) == 1 for s in topo.boxes):
         return values  ## Solved!
     # Choose one of the unfilled squares with the fewest possibilities
-    n, s = min((len(values[s]), s) for s in boxes if len(values[s]) > 1)
+    n, s = min((len(values[s]), s) for s in topo.boxes if len(values[s]) > 1)
     # Now use recurrence to solve each one of the resulting sudokus
     for value in values[s]:
+        if _recorder is not None:
+            _recorder.sync(values)
+        if _tracer is not None:
+            _tracer.branch(s, value, values[s])
         new_sudoku = values.copy()
-        new_sudoku[s] = value
-        attempt = search(new_sudoku)
+        assign_value(new_sudoku, s, value)
+        attempt = search(new_sudoku, topo)
         if attempt:
             return attempt
+    return False
 
 
-def solve(grid):
+def solve(grid, backend='dict', recorder=None, trace=None, variant=None):
     """
     Find the solution to a Sudoku grid.
     Args:
         grid(string): a string representing a sudoku grid.
             Example: '2.............62....1....7...6..8...3...9...7...6..4...4....8....52.............3'
+        backend(string): 'dict' runs the strategies in this module, 'bitmask' runs
+            the same strategies on the candidate mask board in bitboard.py, 'dlx'
+            solves it as an exact cover problem with Dancing Links in dlx.py.
+        recorder(instrument.Recorder): records every change made by the 'dict'
+            backend, e.g. for visualize_assignments. Nothing is recorded by default.
+        trace(instrument.Tracer or bool): emits structured trace events for the
+            'dict' backend. True traces to this module's logger at DEBUG level.
+        variant(Variant or string): the variant to solve, e.g. 'diagonal'. Defaults
+            to the module's default_variant.
     Returns:
         The dictionary representation of the final sudoku grid. False if no solution exists.
     """
-    return naked_twins(reduce_puzzle(grid_values(grid)))
+    global _recorder, _tracer
+    variant = topology(variant)
+    if trace is True:
+        trace = Tracer.to_logger(logger)
+    if backend in ('bitmask', 'dlx'):
+        if recorder is not None or trace:
+            raise ValueError('the %s backend does not support recording or tracing' % backend)
+        if backend == 'dlx':
+            import dlx
+            return dlx.solve(grid, variant)
+        import bitboard
+        return bitboard.solve(grid, variant)
+    if backend != 'dict':
+        raise ValueError('unknown backend: %r' % backend)
+    values = grid_values(grid, variant)
+    if recorder is not None:
+        recorder.begin(values)
+        _recorder = recorder
+    if trace:
+        _tracer = trace
+    try:
+        return search(values, variant)
+    finally:
+        _recorder = None
+        _tracer = None
 
 
 if __name__ == '__main__':
+    logging.basicConfig(filename='solution.log', level=logging.DEBUG)
+
     # diag_sudoku_grid ='..3.2.6..9..3.5..1..18.64....81.29..7.......8..67.82....26.95..8..2.3..9..5.1.3..'
     # diag_sudoku_grid = '2.............62....1....7...6..8...3...9...7...6..4...4....8....52.............3'
     # diagonal test
@@ -289,12 +490,13 @@ if __name__ == '__main__':
     print("\nStarting puzzle: \n")
     display(values)
     print("\nSolved puzzle: \n")
-    display(solve(diag_sudoku_grid))
+    recorder = Recorder()
+    display(solve(diag_sudoku_grid, recorder=recorder))
 
     # try:
     #     from visualize import visualize_assignments
     #
-    #     visualize_assignments(assignments)
+    #     visualize_assignments(recorder)
     #
     # except SystemExit:
     #     sys.exit()
@@ -0,0 +1,37 @@
+import solution
+import unittest
+
+
+class TestStrategies(unittest.TestCase):
+    grid = '4.....8.5.3..........7......2.....6.....8.4......1.......6.3.7.5..2.....1.4......'
+
+    def candidates(self, values):
+        return sum(len(v) for v in values.values())
+
+    def test_advanced_strategies_keep_the_solution(self):
+        solved = solution.search(solution.grid_values(self.grid))
+        basic = solution.reduce_puzzle(solution.grid_values(self.grid), ['eliminate', 'only_choice'])
+        full = solution.reduce_puzzle(solution.grid_values(self.grid))
+        self.assertTrue(self.candidates(full) <= self.candidates(basic))
+        for box in solution.boxes:
+            self.assertIn(solved[box], full[box])
+
+    def test_each_strategy_is_sound(self):
+        solved = solution.search(solution.grid_values(self.grid))
+        for name in solution.strategies:
+            values = solution.reduce_puzzle(solution.grid_values(self.grid), ['eliminate', 'only_choice', name])
+            for box in solution.boxes:
+                self.assertIn(solved[box], values[box], name)
+
+    def test_enable_strategy(self):
+        solution.enable_strategy('swordfish', False)
+        try:
+            self.assertNotIn('swordfish', [s.name for s in solution.active_strategies()])
+        finally:
+            solution.enable_strategy('swordfish')
+        self.assertEqual([s.cost for s in solution.active_strategies()],
+                         sorted(s.cost for s in solution.strategies.values()))
+
+
+if __name__ == '__main__':
+    unittest.main()
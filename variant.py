@@ -0,0 +1,105 @@
+"""Board topologies for the sudoku variants the solvers support.
+
+A Variant bundles the boxes, units and peers of one kind of sudoku, both as
+the string keyed tables solution.py works on and as the index tables the
+bitmask and exact cover engines use. Variants are built once and cached, so
+a process can solve classic, diagonal and custom puzzles side by side without
+rebuilding anything per solve.
+"""
+
+rows = 'ABCDEFGHI'
+cols = '123456789'
+digits = '123456789'
+
+
+def cross(A, B):
+    """ Cross product of elements in A and elements in B. """
+    return [s + t for s in A for t in B]
+
+
+class Variant(object):
+    """Units and peers for one sudoku variant.
+
+    Args:
+        name(string): name of the variant, e.g. 'diagonal'.
+        extra_units(sequence): units on top of rows, columns and regions, as
+            lists of box names (the two diagonals, windoku windows, ...).
+        regions(sequence): replaces the 3x3 squares, e.g. jigsaw regions.
+            None keeps the squares.
+    """
+
+    def __init__(self, name, extra_units=(), regions=None):
+        self.name = name
+        self.rows = rows
+        self.cols = cols
+        self.digits = digits
+        self.boxes = cross(rows, cols)
+        self.row_units = [cross(r, cols) for r in rows]
+        self.column_units = [cross(rows, c) for c in cols]
+        if regions is None:
+            self.square_units = [cross(rs, cs) for rs in ('ABC', 'DEF', 'GHI') for cs in ('123', '456', '789')]
+        else:
+            self.square_units = [list(region) for region in regions]
+        self.extra_units = [list(unit) for unit in extra_units]
+        self.unitlist = self.row_units + self.column_units + self.square_units + self.extra_units
+        self.units = dict((s, [u for u in self.unitlist if s in u]) for s in self.boxes)
+        self.peers = dict((s, set(sum(self.units[s], [])) - set([s])) for s in self.boxes)
+
+        # the same topology as index tables
+        self.index = dict((box, i) for i, box in enumerate(self.boxes))
+        self.unit_indexes = tuple(tuple(self.index[box] for box in unit) for unit in self.unitlist)
+        self.peer_indexes = tuple(tuple(sorted(self.index[peer] for peer in self.peers[box]))
+                                  for box in self.boxes)
+        self.units_of = tuple(tuple(u for u, unit in enumerate(self.unit_indexes) if i in unit)
+                              for i in range(len(self.boxes)))
+        self._key = _key(extra_units, regions)
+
+    def __repr__(self):
+        return 'Variant(%r)' % self.name
+
+    def __reduce__(self):
+        # pickle by reference so worker processes reuse their own cached tables
+        return _load, (self.name,) + self._key
+
+
+def _key(extra_units, regions):
+    return (tuple(tuple(unit) for unit in extra_units),
+            None if regions is None else tuple(tuple(region) for region in regions))
+
+
+# every variant built so far, by topology
+_variants = {}
+
+
+def make_variant(name='custom', extra_units=(), regions=None):
+    """Return the cached Variant with these extra units and regions, building it on first use."""
+    key = _key(extra_units, regions)
+    if key not in _variants:
+        _variants[key] = Variant(name, *key)
+    return _variants[key]
+
+
+def _load(name, extra_units, regions):
+    return make_variant(name, extra_units, regions)
+
+
+diagonal_units = [[r + c for r, c in zip(rows, cols)], [r + c for r, c in zip(rows, cols[::-1])]]
+
+# windoku adds four 3x3 windows offset one box in from the corners
+windoku_units = [cross(rs, cs) for rs in ('BCD', 'FGH') for cs in ('234', '678')]
+
+CLASSIC = make_variant('classic')
+DIAGONAL = make_variant('diagonal', diagonal_units)
+WINDOKU = make_variant('windoku', windoku_units)
+
+variants = {'classic': CLASSIC, 'diagonal': DIAGONAL, 'windoku': WINDOKU}
+
+
+def get_variant(variant):
+    """Look up a variant by name, or pass a Variant straight through."""
+    if isinstance(variant, Variant):
+        return variant
+    try:
+        return variants[variant]
+    except KeyError:
+        raise ValueError('unknown variant: %r' % (variant,))
@@ -0,0 +1,39 @@
+import pickle
+import solution
+import solution_test
+import unittest
+import variant
+
+
+class TestVariant(unittest.TestCase):
+
+    def test_diagonal_per_solve(self):
+        grid = solution_test.TestDiagonalSudoku.diagonal_grid
+        expected = solution_test.TestDiagonalSudoku.solved_diag_sudoku
+        for backend in ('dict', 'bitmask', 'dlx'):
+            self.assertEqual(solution.solve(grid, backend=backend, variant='diagonal'), expected, backend)
+
+    def test_tables_are_cached(self):
+        self.assertIs(variant.make_variant('diagonal', variant.diagonal_units), variant.DIAGONAL)
+        self.assertIs(pickle.loads(pickle.dumps(variant.WINDOKU)), variant.WINDOKU)
+        self.assertEqual(len(variant.DIAGONAL.peers['E5']), 32)
+
+    def test_windoku(self):
+        values = solution.solve('.' * 81, backend='bitmask', variant='windoku')
+        for unit in variant.WINDOKU.unitlist:
+            self.assertEqual(set(values[box] for box in unit), set('123456789'))
+
+    def test_jigsaw_regions(self):
+        # the classic squares with C3 and D3 swapped between the top and middle left regions
+        regions = [list(unit) for unit in variant.CLASSIC.square_units]
+        regions[0][regions[0].index('C3')] = 'D3'
+        regions[3][regions[3].index('D3')] = 'C3'
+        jigsaw = variant.make_variant('jigsaw', regions=regions)
+        self.assertIn('C3', jigsaw.peers['F1'])
+        values = solution.solve('.' * 81, backend='dlx', variant=jigsaw)
+        for unit in jigsaw.unitlist:
+            self.assertEqual(set(values[box] for box in unit), set('123456789'))
+
+
+if __name__ == '__main__':
+    unittest.main()
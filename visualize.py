@@ -1,7 +1,12 @@
 from PySudoku import play
 
 def visualize_assignments(assignments):
-    """ Visualizes the set of assignments created by the Sudoku AI"""
+    """ Visualizes the set of assignments created by the Sudoku AI
+
+    Takes either a list of board snapshots or the instrument.Recorder passed to solve().
+    """
+    if hasattr(assignments, 'placements'):
+        assignments = list(assignments.placements())
     last_assignment = None
     filtered_assignments = []
 